@@ -10,15 +10,41 @@ For additional components, import from submodules:
     from buildgen.common.project import TargetConfig, DependencyConfig
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.10"
 
-# Core API - minimal exports for early development flexibility
-from buildgen.common.project import ProjectConfig
-from buildgen.makefile.generator import MakefileGenerator
-from buildgen.cmake.generator import CMakeListsGenerator
+# Core API - minimal exports for early development flexibility.
+# Submodules are imported lazily on first attribute access (PEP 562) so that
+# `import buildgen` (and therefore every CLI invocation) stays cheap.
+_LAZY_EXPORTS: dict[str, str] = {
+    "ProjectConfig": "buildgen.common.project",
+    "MakefileGenerator": "buildgen.makefile.generator",
+    "CMakeListsGenerator": "buildgen.cmake.generator",
+}
+
+if TYPE_CHECKING:
+    from buildgen.common.project import ProjectConfig
+    from buildgen.makefile.generator import MakefileGenerator
+    from buildgen.cmake.generator import CMakeListsGenerator
 
 __all__ = [
     "ProjectConfig",
     "MakefileGenerator",
     "CMakeListsGenerator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -7,21 +7,47 @@ The CLI is now split into:
 - main.py: Entry point
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# main is imported eagerly: the buildgen.cli.main submodule shares its name,
+# and importing that submodule would otherwise rebind cli.main to the module.
+# main.py itself defers loading the parsers and commands.
 from buildgen.cli.main import main
-from buildgen.cli.parsers import create_parser
-from buildgen.cli.commands import (
-    cmd_new,
-    cmd_list,
-    cmd_test,
-    cmd_generate,
-    cmd_render,
-    cmd_templates_list,
-    cmd_templates_copy,
-    cmd_templates_show,
-    cmd_config_init,
-    cmd_config_show,
-    cmd_config_path,
-)
+
+# The parsers and commands are imported lazily on first attribute access
+# (PEP 562), so that the console entry point can answer e.g. --version
+# without loading them.
+_LAZY_EXPORTS: dict[str, str] = {
+    "create_parser": "buildgen.cli.parsers",
+    "cmd_new": "buildgen.cli.commands",
+    "cmd_list": "buildgen.cli.commands",
+    "cmd_test": "buildgen.cli.commands",
+    "cmd_generate": "buildgen.cli.commands",
+    "cmd_render": "buildgen.cli.commands",
+    "cmd_templates_list": "buildgen.cli.commands",
+    "cmd_templates_copy": "buildgen.cli.commands",
+    "cmd_templates_show": "buildgen.cli.commands",
+    "cmd_config_init": "buildgen.cli.commands",
+    "cmd_config_show": "buildgen.cli.commands",
+    "cmd_config_path": "buildgen.cli.commands",
+}
+
+if TYPE_CHECKING:
+    from buildgen.cli.parsers import create_parser
+    from buildgen.cli.commands import (
+        cmd_new,
+        cmd_list,
+        cmd_test,
+        cmd_generate,
+        cmd_render,
+        cmd_templates_list,
+        cmd_templates_copy,
+        cmd_templates_show,
+        cmd_config_init,
+        cmd_config_show,
+        cmd_config_path,
+    )
 
 __all__ = [
     "main",
@@ -38,3 +64,17 @@ __all__ = [
     "cmd_config_show",
     "cmd_config_path",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
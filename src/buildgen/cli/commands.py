@@ -1,15 +1,17 @@
 """CLI command implementations for buildgen."""
 
 import argparse
-import copy
+import functools
 import json
+import os
 import re
 import shutil
 import sys
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
-
-from mako.template import Template
+from typing import TYPE_CHECKING, Any, Optional
 
 from buildgen.recipes import (
     RECIPES,
@@ -18,16 +20,115 @@ from buildgen.recipes import (
     get_recipes_by_category,
     is_valid_recipe,
 )
-from buildgen.templates.resolver import (
-    TemplateResolver,
-    copy_templates,
+
+if TYPE_CHECKING:
+    from mako.template import Template
+
+    from buildgen.common.config import UserConfig
+
+# Display order and headings for recipe categories
+CATEGORY_ORDER = ("cpp", "c", "py")
+RECIPE_CATEGORY_NAMES = {
+    "cpp": "C++ Recipes",
+    "c": "C Recipes",
+    "py": "Python Extension Recipes",
+}
+TEMPLATE_CATEGORY_NAMES = {
+    "py": "Python Extension Templates",
+    "cpp": "C++ Templates",
+    "c": "C Templates",
+}
+
+# Boilerplate written by 'buildgen generate --config'
+DEFAULT_YAML_CONFIG = """# buildgen project configuration
+name: myproject
+version: "0.1.0"
+
+# C++ standard (11, 14, 17, 20, 23)
+cxx_standard: 17
+
+# Compiler flags
+cflags: []
+cxxflags: []
+ldflags: []
+
+# Include directories
+include_dirs: []
+
+# Libraries to link
+ldlibs: []
+
+# Targets
+targets:
+  - name: myapp
+    type: executable
+    sources:
+      - src/main.cpp
+"""
+
+DEFAULT_JSON_CONFIG = json.dumps(
+    {
+        "name": "myproject",
+        "version": "0.1.0",
+        "cxx_standard": 17,
+        "cflags": [],
+        "cxxflags": [],
+        "ldflags": [],
+        "include_dirs": [],
+        "ldlibs": [],
+        "targets": [
+            {
+                "name": "myapp",
+                "type": "executable",
+                "sources": ["src/main.cpp"],
+            }
+        ],
+    },
+    indent=2,
 )
 
+# Placeholder syntax used by configurable recipe configs, e.g. <options.env>
+_OPTION_TOKEN_RE = re.compile(r"<options\.([a-zA-Z0-9_]+)>")
+
+
+def _relative_paths(paths: list[Path], base: Path) -> list[str]:
+    """Render created file paths relative to their output directory.
+
+    Generated files always live under ``base``, so stripping the string
+    prefix gives the same result as ``Path.relative_to`` without re-parsing
+    each path.
+    """
+    prefix = os.path.join(str(base), "")
+    size = len(prefix)
+    return [
+        path[size:] if path.startswith(prefix) else path for path in map(str, paths)
+    ]
+
+
+@functools.cache
+def _cmake_recipe_names() -> frozenset[str]:
+    """Return the names of all CMake-based recipes (computed once)."""
+    from buildgen.cmake.project_generator import is_cmake_recipe
+
+    return frozenset(name for name in RECIPES if is_cmake_recipe(name))
+
+
+def _check_env_tool(env_tool: str | None) -> None:
+    """Exit with an error if an explicitly requested env tool is unknown."""
+    from buildgen.skbuild.templates import ENV_TOOLS
+
+    if env_tool is not None and env_tool not in ENV_TOOLS:
+        valid = ", ".join(ENV_TOOLS)
+        print(
+            f"Error: Invalid env option '{env_tool}'. Valid: {valid}", file=sys.stderr
+        )
+        sys.exit(1)
+
 
 def cmd_new(args: argparse.Namespace) -> None:
     """Create a new project from a recipe."""
     from buildgen.skbuild.generator import SkbuildProjectGenerator
-    from buildgen.cmake.project_generator import CMakeProjectGenerator, is_cmake_recipe
+    from buildgen.cmake.project_generator import CMakeProjectGenerator
     from buildgen.common.config import load_user_config
 
     name = args.name
@@ -40,6 +141,8 @@ def cmd_new(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     recipe = get_recipe(recipe_name)
+    # Legacy names (e.g. "executable") resolve to their canonical recipe
+    recipe_name = recipe.name
 
     # Determine output directory
     output_dir = Path(args.output) if args.output else Path(name)
@@ -48,7 +151,8 @@ def cmd_new(args: argparse.Namespace) -> None:
     user_config = load_user_config()
 
     # Apply defaults from user config: only when --env was not explicitly passed
-    env_tool = getattr(args, "env", None)
+    env_tool = args.env
+    _check_env_tool(env_tool)
     if env_tool is None:
         env_tool = user_config.defaults.get("env_tool", "uv")
 
@@ -59,34 +163,49 @@ def cmd_new(args: argparse.Namespace) -> None:
 
     # Handle scikit-build-core templates (py/* recipes)
     if recipe.build_system == "skbuild":
-        skbuild_type = f"skbuild-{recipe.framework}"
         gen = SkbuildProjectGenerator(
-            name, skbuild_type, output_dir, env_tool=env_tool, user_config=user_config
+            name,
+            recipe.skbuild_type,
+            output_dir,
+            env_tool=env_tool,
+            user_config=user_config,
         )
         created = gen.generate()
-        print(f"Created {recipe.name} project: {gen.output_dir}/")
-        print(f"  (using {env_tool} for Makefile commands)")
-        for path in created:
-            rel_path = path.relative_to(gen.output_dir)
-            print(f"  {rel_path}")
+        lines = [
+            f"Created {recipe.name} project: {gen.output_dir}/",
+            f"  (using {env_tool} for Makefile commands)",
+        ]
+        lines.extend(f"  {p}" for p in _relative_paths(created, gen.output_dir))
+        sys.stdout.write("\n".join(lines) + "\n")
         return
 
     # Handle CMake-based templates (cpp/* and c/* recipes)
-    if is_cmake_recipe(recipe_name):
+    if recipe_name in _cmake_recipe_names():
         cmake_gen = CMakeProjectGenerator(
             name, recipe_name, output_dir, user_config=user_config
         )
         created = cmake_gen.generate()
-        print(f"Created {recipe.name} project: {cmake_gen.output_dir}/")
-        for path in created:
-            rel_path = path.relative_to(cmake_gen.output_dir)
-            print(f"  {rel_path}")
+        lines = [f"Created {recipe.name} project: {cmake_gen.output_dir}/"]
+        lines.extend(f"  {p}" for p in _relative_paths(created, cmake_gen.output_dir))
+        sys.stdout.write("\n".join(lines) + "\n")
         return
 
     print(f"Error: No generator available for recipe '{recipe_name}'", file=sys.stderr)
     sys.exit(1)
 
 
+@functools.lru_cache(maxsize=64)
+def _load_config_template(path: str, mtime_ns: int) -> "Template":
+    """Compile a config template, reusing it while the file is unchanged.
+
+    ``mtime_ns`` is only part of the cache key, so an edited override
+    template is recompiled rather than served stale.
+    """
+    from mako.template import Template
+
+    return Template(filename=path)
+
+
 def _generate_config_file(
     recipe: "Recipe",
     name: str,
@@ -97,6 +216,7 @@ def _generate_config_file(
 ) -> None:
     """Render the config template for configurable recipes."""
     from buildgen.common.config import UserConfig
+    from buildgen.templates.resolver import TemplateResolver
 
     if not recipe.config_template:
         raise ValueError(
@@ -106,7 +226,9 @@ def _generate_config_file(
     output_dir.mkdir(parents=True, exist_ok=True)
     resolver = TemplateResolver(output_dir)
     template_path, _ = resolver.resolve(recipe.name, recipe.config_template)
-    template = Template(filename=str(template_path))
+    template = _load_config_template(
+        str(template_path), template_path.stat().st_mtime_ns
+    )
 
     base_options = dict(recipe.default_options)
     if options:
@@ -135,44 +257,137 @@ def cmd_list(args: argparse.Namespace) -> None:
     """List available recipes."""
     categories = get_recipes_by_category()
 
-    category_names = {
-        "cpp": "C++ Recipes",
-        "c": "C Recipes",
-        "py": "Python Extension Recipes",
-    }
-
     # Filter by category if specified
-    category_filter = getattr(args, "category", None)
+    category_filter = args.category
 
-    print("Available recipes:\n")
-    for category in ["cpp", "c", "py"]:
+    # Build the whole listing and emit it with a single write
+    lines = ["Available recipes:\n"]
+    for category in CATEGORY_ORDER:
         if category not in categories:
             continue
         if category_filter and category != category_filter:
             continue
-        print(f"{category_names.get(category, category)}:")
+        lines.append(f"{RECIPE_CATEGORY_NAMES.get(category, category)}:")
         for recipe in categories[category]:
-            print(f"  {recipe.name:<25} {recipe.description}")
-        print()
+            lines.append(f"  {recipe.name:<25} {recipe.description}")
+        lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def cmd_test(args: argparse.Namespace) -> None:
-    """Test recipe generation and building."""
+@dataclass(slots=True)
+class RecipeResult:
+    """Outcome of testing a single recipe with 'buildgen test'."""
+
+    generate: bool = False
+    build: bool = False
+    test: bool = False
+    error: str | None = None
+
+
+def _run_step(cmd: list[str], cwd: Path, timeout: int, failure: str) -> str | None:
+    """Run one build or test command, returning an error message if it fails.
+
+    stdout is discarded and stderr kept as bytes; only the tail is decoded
+    on failure, since that is where compilers and test runners report the
+    actual error.
+    """
+    import subprocess
+
+    proc = subprocess.run(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        timeout=timeout,
+    )
+    if proc.returncode == 0:
+        return None
+    if proc.stderr:
+        return proc.stderr[-500:].decode("utf-8", errors="replace")
+    return failure
+
+
+def _test_recipe(
+    recipe_name: str, base_dir: Path, do_build: bool, do_test: bool
+) -> RecipeResult:
+    """Generate, and optionally build and test, a single recipe.
+
+    Each recipe is generated into its own directory under ``base_dir``, so
+    calls for different recipes share no state and may run concurrently.
+    """
     import subprocess
-    import tempfile
 
     from buildgen.skbuild.generator import SkbuildProjectGenerator
-    from buildgen.cmake.project_generator import CMakeProjectGenerator, is_cmake_recipe
+    from buildgen.cmake.project_generator import CMakeProjectGenerator
+
+    recipe = RECIPES[recipe_name]
+    project_name = recipe_name.replace("/", "_").replace("-", "_")
+    project_dir = base_dir / project_name
+
+    result = RecipeResult()
+
+    try:
+        # Start from a clean directory; a missing one is the common case
+        shutil.rmtree(project_dir, ignore_errors=True)
+
+        if recipe.build_system == "skbuild":
+            gen = SkbuildProjectGenerator(
+                project_name, recipe.skbuild_type, project_dir, env_tool="uv"
+            )
+            gen.generate()
+        elif recipe_name in _cmake_recipe_names():
+            cmake_gen = CMakeProjectGenerator(project_name, recipe_name, project_dir)
+            cmake_gen.generate()
+        else:
+            result.error = "No generator available"
+            return result
+
+        result.generate = True
+
+        if do_build:
+            if recipe.build_system == "skbuild":
+                result.error = _run_step(
+                    ["uv", "sync"], project_dir, 300, "Build failed"
+                )
+            else:
+                result.error = _run_step(["make"], project_dir, 120, "Build failed")
+            result.build = result.error is None
+
+            if result.build and do_test:
+                if recipe.build_system == "skbuild":
+                    # The environment was just synced above; don't let
+                    # 'uv run' resolve and sync it a second time
+                    cmd = ["uv", "run", "--no-sync", "pytest", "-v"]
+                else:
+                    cmd = ["make", "test"]
+                result.error = _run_step(cmd, project_dir, 120, "Tests failed")
+                result.test = result.error is None
+
+    except subprocess.TimeoutExpired:
+        result.error = "Timeout"
+    except Exception as e:
+        result.error = str(e)[:500]
+
+    return result
+
+
+def cmd_test(args: argparse.Namespace) -> None:
+    """Test recipe generation and building."""
+    import os
+    import tempfile
+    import time
+    from concurrent.futures import ThreadPoolExecutor
 
     # Handle --all flag (shortcut for --build --test)
-    do_build = args.build or getattr(args, "all", False)
-    do_test = args.test or getattr(args, "all", False)
+    do_build = args.build or args.all
+    do_test = args.test or args.all
 
     # Determine which recipes to test
     recipes_to_test = []
     if args.name:
         if args.name not in RECIPES:
             print(f"Error: Unknown recipe '{args.name}'", file=sys.stderr)
+            print("\nUse 'buildgen list' to see available recipes.")
             sys.exit(1)
         recipes_to_test = [args.name]
     elif args.category:
@@ -184,6 +399,13 @@ def cmd_test(args: argparse.Namespace) -> None:
     else:
         recipes_to_test = list(RECIPES.keys())
 
+    # Recipes are independent and mostly wait on external compilers, so
+    # they are tested concurrently (default: one worker per CPU)
+    jobs = args.jobs or os.cpu_count() or 1
+    if jobs < 1:
+        print("Error: --jobs must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
     # Use provided output directory or create temp directory
     if args.output:
         base_dir = Path(args.output)
@@ -193,139 +415,81 @@ def cmd_test(args: argparse.Namespace) -> None:
         base_dir = Path(tempfile.mkdtemp(prefix="buildgen-test-"))
         cleanup = not args.keep
 
-    results: dict[str, dict] = {}
+    results: dict[str, RecipeResult] = {}
     print(f"Testing {len(recipes_to_test)} recipes in {base_dir}\n")
 
-    for recipe_name in recipes_to_test:
-        recipe = RECIPES[recipe_name]
-        project_name = recipe_name.replace("/", "_").replace("-", "_")
-        project_dir = base_dir / project_name
-
-        result: dict[str, bool | str | None] = {
-            "generate": False,
-            "build": False,
-            "test": False,
-            "error": None,
-        }
-
-        try:
-            if project_dir.exists():
-                shutil.rmtree(project_dir)
-
-            if recipe.build_system == "skbuild":
-                skbuild_type = f"skbuild-{recipe.framework}"
-                gen = SkbuildProjectGenerator(
-                    project_name, skbuild_type, project_dir, env_tool="uv"
-                )
-                gen.generate()
-            elif is_cmake_recipe(recipe_name):
-                cmake_gen = CMakeProjectGenerator(
-                    project_name, recipe_name, project_dir
-                )
-                cmake_gen.generate()
+    def run_one(recipe_name: str) -> RecipeResult:
+        return _test_recipe(recipe_name, base_dir, do_build, do_test)
+
+    # On a terminal, successful recipes share one status line that is
+    # rewritten in place and flushed at most once per second; errors (and
+    # all rows when output is redirected) get a line of their own
+    interactive = sys.stdout.isatty()
+    count = len(recipes_to_test)
+    status_width = 0
+    last_flush = 0.0
+
+    with ThreadPoolExecutor(max_workers=min(jobs, count or 1)) as pool:
+        # map() yields in submission order, keeping the report deterministic
+        for i, (recipe_name, result) in enumerate(
+            zip(recipes_to_test, pool.map(run_one, recipes_to_test)), 1
+        ):
+            results[recipe_name] = result
+
+            status_parts = []
+            if result.generate:
+                status_parts.append("generated")
+            if result.build:
+                status_parts.append("built")
+            if result.test:
+                status_parts.append("tested")
+            if result.error:
+                status_parts.append(f"ERROR: {result.error[:60]}")
+
+            status = ", ".join(status_parts) if status_parts else "failed"
+            line = f"  {recipe_name:<25} {status}"
+            if not interactive:
+                print(line, flush=True)
+            elif result.error:
+                # Clear the status line and keep the error visible
+                sys.stdout.write(f"\r{' ' * status_width}\r{line}\n")
+                sys.stdout.flush()
+                status_width = 0
+                last_flush = time.monotonic()
             else:
-                result["error"] = "No generator available"
-                results[recipe_name] = result
-                continue
+                progress = f"  {i}/{count} {recipe_name:<25} {status}"
+                sys.stdout.write(f"\r{progress.ljust(status_width)}")
+                status_width = len(progress)
+                now = time.monotonic()
+                if i == count or now - last_flush >= 1.0:
+                    sys.stdout.flush()
+                    last_flush = now
 
-            result["generate"] = True
+    if status_width:
+        sys.stdout.write("\n")
 
-            if do_build:
-                if recipe.build_system == "skbuild":
-                    proc = subprocess.run(
-                        ["uv", "sync"],
-                        cwd=project_dir,
-                        capture_output=True,
-                        text=True,
-                        timeout=300,
-                    )
-                    if proc.returncode == 0:
-                        result["build"] = True
-                    else:
-                        result["error"] = (
-                            proc.stderr[:500] if proc.stderr else "Build failed"
-                        )
-                else:
-                    proc = subprocess.run(
-                        ["make"],
-                        cwd=project_dir,
-                        capture_output=True,
-                        text=True,
-                        timeout=120,
-                    )
-                    if proc.returncode == 0:
-                        result["build"] = True
-                    else:
-                        result["error"] = (
-                            proc.stderr[:500] if proc.stderr else "Build failed"
-                        )
-
-                if result["build"] and do_test:
-                    if recipe.build_system == "skbuild":
-                        proc = subprocess.run(
-                            ["uv", "run", "pytest", "-v"],
-                            cwd=project_dir,
-                            capture_output=True,
-                            text=True,
-                            timeout=120,
-                        )
-                    else:
-                        proc = subprocess.run(
-                            ["make", "test"],
-                            cwd=project_dir,
-                            capture_output=True,
-                            text=True,
-                            timeout=120,
-                        )
-                    if proc.returncode == 0:
-                        result["test"] = True
-                    else:
-                        result["error"] = (
-                            proc.stderr[:500] if proc.stderr else "Tests failed"
-                        )
-
-        except subprocess.TimeoutExpired:
-            result["error"] = "Timeout"
-        except Exception as e:
-            result["error"] = str(e)[:500]
-
-        results[recipe_name] = result
-
-        status_parts = []
-        if result["generate"]:
-            status_parts.append("generated")
-        if result["build"]:
-            status_parts.append("built")
-        if result["test"]:
-            status_parts.append("tested")
-        if result["error"]:
-            err = str(result["error"])
-            status_parts.append(f"ERROR: {err[:60]}")
-
-        status = ", ".join(status_parts) if status_parts else "failed"
-        print(f"  {recipe_name:<25} {status}")
-
-    print("\n" + "=" * 60)
     total = len(results)
-    generated = sum(1 for r in results.values() if r["generate"])
-    built = sum(1 for r in results.values() if r["build"])
-    tested = sum(1 for r in results.values() if r["test"])
-    failed = sum(1 for r in results.values() if r["error"])
-
-    print(f"Total: {total}, Generated: {generated}", end="")
+    generated = built = tested = failed = 0
+    for r in results.values():
+        generated += bool(r.generate)
+        built += bool(r.build)
+        tested += bool(r.test)
+        failed += bool(r.error)
+
+    summary = [f"Total: {total}", f"Generated: {generated}"]
     if do_build:
-        print(f", Built: {built}", end="")
+        summary.append(f"Built: {built}")
     if do_test:
-        print(f", Tested: {tested}", end="")
+        summary.append(f"Tested: {tested}")
     if failed:
-        print(f", Failed: {failed}", end="")
-    print()
+        summary.append(f"Failed: {failed}")
 
     if cleanup:
         shutil.rmtree(base_dir)
-        print(f"\nCleaned up {base_dir}")
+        footer = f"Cleaned up {base_dir}"
     else:
-        print(f"\nOutput preserved in {base_dir}")
+        footer = f"Output preserved in {base_dir}"
+    sys.stdout.write(f"\n{'=' * 60}\n{', '.join(summary)}\n\n{footer}\n")
 
     if failed > 0:
         sys.exit(1)
@@ -339,52 +503,11 @@ def cmd_generate(args: argparse.Namespace) -> None:
     if args.config:
         config_path = Path(args.config)
 
-        # Create a basic config template
+        # Boilerplate content is static, so it is prepared at import time
         if config_path.suffix in (".yaml", ".yml"):
-            content = """# buildgen project configuration
-name: myproject
-version: "0.1.0"
-
-# C++ standard (11, 14, 17, 20, 23)
-cxx_standard: 17
-
-# Compiler flags
-cflags: []
-cxxflags: []
-ldflags: []
-
-# Include directories
-include_dirs: []
-
-# Libraries to link
-ldlibs: []
-
-# Targets
-targets:
-  - name: myapp
-    type: executable
-    sources:
-      - src/main.cpp
-"""
+            content = DEFAULT_YAML_CONFIG
         else:
-            config_data = {
-                "name": "myproject",
-                "version": "0.1.0",
-                "cxx_standard": 17,
-                "cflags": [],
-                "cxxflags": [],
-                "ldflags": [],
-                "include_dirs": [],
-                "ldlibs": [],
-                "targets": [
-                    {
-                        "name": "myapp",
-                        "type": "executable",
-                        "sources": ["src/main.cpp"],
-                    }
-                ],
-            }
-            content = json.dumps(config_data, indent=2)
+            content = DEFAULT_JSON_CONFIG
 
         config_path.write_text(content)
         print(f"Created config template: {config_path}")
@@ -421,7 +544,7 @@ targets:
 
 def cmd_render(args: argparse.Namespace) -> None:
     """Render a configurable recipe config into a full project."""
-    from buildgen.skbuild.generator import SkbuildProjectGenerator, ENV_TOOLS
+    from buildgen.skbuild.generator import SkbuildProjectGenerator
     from buildgen.common.config import load_user_config
 
     config_path = Path(args.config)
@@ -458,41 +581,32 @@ def cmd_render(args: argparse.Namespace) -> None:
     user_config = load_user_config()
 
     output_dir = Path(args.output) if args.output else config_path.parent / project_name
+    explicit_env = args.env
     options = _prepare_recipe_options(
-        recipe, data.get("options", {}), override_env=getattr(args, "env", None)
+        recipe, data.get("options", {}), override_env=explicit_env
     )
 
     # Explicit --env flag overrides options; options override user config default
-    explicit_env = getattr(args, "env", None)
     if explicit_env:
         env_tool = explicit_env
     else:
         env_tool = options.get("env", None) or user_config.defaults.get(
             "env_tool", "uv"
         )
-    if env_tool not in ENV_TOOLS:
-        valid = ", ".join(ENV_TOOLS)
-        print(
-            f"Error: Invalid env option '{env_tool}'. Valid: {valid}", file=sys.stderr
-        )
-        sys.exit(1)
+    _check_env_tool(env_tool)
 
-    skbuild_type = f"skbuild-{recipe.framework}"
     output_dir.mkdir(parents=True, exist_ok=True)
     gen = SkbuildProjectGenerator(
         project_name,
-        skbuild_type,
+        recipe.skbuild_type,
         output_dir,
         env_tool=env_tool,
         context={"options": options},
         user_config=user_config,
     )
-    created = gen.generate()
-
-    generated_flex = output_dir / config_path.name
-    if generated_flex.exists():
-        generated_flex.unlink()
-        created = [p for p in created if p != generated_flex]
+    # The configurable template (e.g. project.flex.json) is replaced by the
+    # plain config written below, so never emit it in the first place
+    created = gen.generate(exclude={config_path.name})
 
     plain_config = _create_plain_config(data, options)
     output_config_name = _determine_plain_config_name(config_path.name)
@@ -500,15 +614,16 @@ def cmd_render(args: argparse.Namespace) -> None:
     _write_plain_config(output_config, plain_config)
     created.append(output_config)
 
-    print(f"Rendered {recipe.name} to {output_dir}/")
-    for path in created:
-        rel_path = path.relative_to(output_dir)
-        print(f"  {rel_path}")
+    lines = [f"Rendered {recipe.name} to {output_dir}/"]
+    lines.extend(f"  {p}" for p in _relative_paths(created, output_dir))
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _load_configurable_config(path: Path) -> dict[str, Any]:
     """Load configurable recipe config file (YAML or JSON)."""
     ext = path.suffix.lower()
+    # Read once; both parsers accept UTF-8 bytes directly
+    raw = path.read_bytes()
 
     def _load_yaml() -> dict[str, Any]:
         try:
@@ -518,15 +633,15 @@ def _load_configurable_config(path: Path) -> dict[str, Any]:
                 "pyyaml is required for YAML configs. Install with 'pip install pyyaml'."
             ) from exc
 
-        with path.open("r", encoding="utf-8") as handle:
-            data = yaml.safe_load(handle)
+        # Prefer the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = yaml.load(raw, Loader=loader)
         if not isinstance(data, dict):
             raise ValueError("YAML config must be a mapping at the top level")
         return data
 
     def _load_json() -> dict[str, Any]:
-        with path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        data = json.loads(raw)
         if not isinstance(data, dict):
             raise ValueError("JSON config must be a mapping at the top level")
         return data
@@ -565,42 +680,119 @@ def _determine_plain_config_name(source_name: str) -> str:
     return source_name
 
 
+def _resolve_str(value: str, options: dict[str, Any]) -> str:
+    """Substitute <options.foo> placeholders in a single string."""
+    if "<options." not in value:
+        return value
+
+    def repl(match: re.Match[str]) -> str:
+        key = match.group(1)
+        if key in options:
+            return str(options[key])
+        return match.group(0)
+
+    return _OPTION_TOKEN_RE.sub(repl, value)
+
+
+def _resolve_dict(value: dict[str, Any], options: dict[str, Any]) -> dict[str, Any]:
+    """Resolve placeholders in every value of a mapping."""
+    return {k: _resolve_option_tokens(v, options) for k, v in value.items()}
+
+
+def _resolve_list(value: list[Any], options: dict[str, Any]) -> list[Any]:
+    """Resolve placeholders in every item of a list."""
+    return [_resolve_option_tokens(v, options) for v in value]
+
+
+# Configs come from json/yaml.safe_load, which only produce exact dict/list/str
+# containers, so dispatch on type() instead of a chain of isinstance() checks
+_RESOLVE_DISPATCH: dict[type, Callable[[Any, dict[str, Any]], Any]] = {
+    dict: _resolve_dict,
+    list: _resolve_list,
+    str: _resolve_str,
+}
+
+
 def _resolve_option_tokens(value: Any, options: dict[str, Any]) -> Any:
     """Replace <options.foo> placeholders with actual option values."""
-    if isinstance(value, dict):
-        return {k: _resolve_option_tokens(v, options) for k, v in value.items()}
-    if isinstance(value, list):
-        return [_resolve_option_tokens(v, options) for v in value]
-    if isinstance(value, str):
-        pattern = re.compile(r"<options\.([a-zA-Z0-9_]+)>")
+    handler = _RESOLVE_DISPATCH.get(type(value))
+    if handler is None:
+        return value
+    return handler(value, options)
 
-        def repl(match: re.Match[str]) -> str:
-            key = match.group(1)
-            if key in options:
-                return str(options[key])
-            return match.group(0)
 
-        return pattern.sub(repl, value)
-    return value
+# Metadata keys stripped when rendering a configurable config
+_PLAIN_CONFIG_SKIP_KEYS = frozenset({"options", "_notes", "_options_help"})
 
 
 def _create_plain_config(
     data: dict[str, Any], options: dict[str, Any]
 ) -> dict[str, Any]:
-    """Create a config dict without options metadata."""
-    filtered = {
-        key: copy.deepcopy(value)
+    """Create a config dict without options metadata.
+
+    Resolving rebuilds every dict and list, so the result shares no mutable
+    containers with ``data`` and needs no separate deep copy.
+    """
+    return {
+        key: _resolve_option_tokens(value, options)
         for key, value in data.items()
-        if key not in ("options", "_notes", "_options_help")
+        if key not in _PLAIN_CONFIG_SKIP_KEYS
     }
-    return _resolve_option_tokens(filtered, options)
+
+
+def _dump_json_bytes(data: dict[str, Any]) -> bytes:
+    """Serialize a config as indented JSON, using orjson when installed.
+
+    The output is the same as ``json.dumps(data, indent=2)`` either way.
+    orjson only sees configs built from types both encoders write alike
+    (see :func:`_orjson_compatible`); anything else, and any value orjson
+    rejects (e.g. integers beyond 64 bits), goes through the stdlib encoder.
+    """
+    if not _orjson_compatible(data):
+        return _dump_json_bytes_stdlib(data)
+    try:
+        import orjson
+    except ImportError:
+        return _dump_json_bytes_stdlib(data)
+
+    option = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+    try:
+        return orjson.dumps(data, option=option)
+    except TypeError:
+        return _dump_json_bytes_stdlib(data)
+
+
+def _orjson_compatible(value: Any) -> bool:
+    """Return True if orjson would encode ``value`` exactly like json.
+
+    Floats are excluded (orjson writes ``1e-05`` as ``0.00001`` and NaN as
+    ``null``), as is non-ASCII text (json escapes it) and any type json
+    itself cannot encode, such as dates loaded from YAML.
+    """
+    kind = type(value)
+    if kind is str:
+        return value.isascii()
+    if kind is dict:
+        return all(
+            (type(key) is int or (type(key) is str and key.isascii()))
+            and _orjson_compatible(item)
+            for key, item in value.items()
+        )
+    if kind is list:
+        return all(_orjson_compatible(item) for item in value)
+    return kind is int or kind is bool or value is None
+
+
+def _dump_json_bytes_stdlib(data: dict[str, Any]) -> bytes:
+    """Serialize a config as indented JSON with the stdlib encoder."""
+    return (json.dumps(data, indent=2) + "\n").encode("utf-8")
 
 
 def _write_plain_config(path: Path, data: dict[str, Any]) -> None:
     """Write plain config to disk as JSON or YAML."""
     suffix = path.suffix.lower()
     if suffix == ".json":
-        path.write_text(json.dumps(data, indent=2) + "\n")
+        path.write_bytes(_dump_json_bytes(data))
         return
 
     if suffix in (".yaml", ".yml"):
@@ -611,11 +803,13 @@ def _write_plain_config(path: Path, data: dict[str, Any]) -> None:
                 "pyyaml is required to render YAML configs. Install with 'pip install pyyaml'."
             ) from exc
 
-        path.write_text(yaml.safe_dump(data, sort_keys=False))
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        content = yaml.dump(data, Dumper=dumper, sort_keys=False)
+        path.write_bytes(content.encode("utf-8"))
         return
 
     # Default to JSON for unknown extensions
-    path.write_text(json.dumps(data, indent=2) + "\n")
+    path.write_bytes(_dump_json_bytes(data))
 
 
 def cmd_templates_list(args: argparse.Namespace) -> None:
@@ -627,41 +821,48 @@ def cmd_templates_list(args: argparse.Namespace) -> None:
 
     resolver = TemplateResolver(Path.cwd())
     recipes = get_builtin_template_recipes()
+    all_overrides = resolver.scan_all_overrides()
 
     # Group by category
-    by_category: dict[str, list[str]] = {}
+    by_category: defaultdict[str, list[str]] = defaultdict(list)
     for recipe in recipes:
-        category = recipe.split("/")[0]
-        if category not in by_category:
-            by_category[category] = []
-        by_category[category].append(recipe)
-
-    category_names = {
-        "py": "Python Extension Templates",
-        "cpp": "C++ Templates",
-        "c": "C Templates",
-    }
+        by_category[recipe.partition("/")[0]].append(recipe)
 
-    print("Available templates:\n")
+    # Build the whole listing and emit it with a single write
+    lines = ["Available templates:\n"]
     for category, recipe_list in by_category.items():
-        print(f"{category_names.get(category, category)}:")
+        lines.append(f"{TEMPLATE_CATEGORY_NAMES.get(category, category)}:")
         for recipe in recipe_list:
             # Check for overrides
-            overrides = resolver.list_overrides(recipe)
+            overrides = all_overrides.get(recipe)
             if overrides:
                 sources = set(overrides.values())
                 source_str = ", ".join(sorted(sources))
-                print(f"  {recipe:<20} (override: {source_str})")
+                lines.append(f"  {recipe:<20} (override: {source_str})")
             else:
-                print(f"  {recipe:<20}")
-        print()
+                lines.append(f"  {recipe:<20}")
+        lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_templates_copy(args: argparse.Namespace) -> None:
     """Copy templates for customization."""
-    from buildgen.skbuild.templates import get_recipe_path
+    from buildgen.skbuild.templates import SKBUILD_TYPES, get_recipe_path
+    from buildgen.templates.resolver import (
+        copy_templates,
+        get_builtin_template_recipes,
+    )
 
     template_type = args.recipe
+    # Accept recipe paths plus legacy names for backward compat
+    if (
+        template_type not in SKBUILD_TYPES
+        and template_type not in get_builtin_template_recipes()
+    ):
+        print(f"Unknown template: {template_type}", file=sys.stderr)
+        print("\nUse 'buildgen templates list' to see available templates.")
+        sys.exit(1)
+
     # Convert legacy type to recipe path if needed
     recipe_path = get_recipe_path(template_type)
 
@@ -673,10 +874,9 @@ def cmd_templates_copy(args: argparse.Namespace) -> None:
 
     try:
         copied = copy_templates(recipe_path, dest_dir)
-        print(f"Copied {len(copied)} files to {dest_dir / recipe_path}/")
-        for path in copied:
-            rel_path = path.relative_to(dest_dir)
-            print(f"  {rel_path}")
+        lines = [f"Copied {len(copied)} files to {dest_dir / recipe_path}/"]
+        lines.extend(f"  {p}" for p in _relative_paths(copied, dest_dir))
+        sys.stdout.write("\n".join(lines) + "\n")
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -688,7 +888,7 @@ def cmd_templates_show(args: argparse.Namespace) -> None:
         resolve_template_files,
         SKBUILD_TYPES,
         get_recipe_path,
-        LEGACY_TO_RECIPE_PATH,
+        RECIPE_PATH_TO_LEGACY,
     )
 
     template_type = args.recipe
@@ -697,22 +897,17 @@ def cmd_templates_show(args: argparse.Namespace) -> None:
     # Check if it's a valid skbuild type (either legacy or recipe path)
     if (
         template_type not in SKBUILD_TYPES
-        and template_type not in LEGACY_TO_RECIPE_PATH.values()
+        and template_type not in RECIPE_PATH_TO_LEGACY
     ):
         print(f"Unknown template: {template_type}", file=sys.stderr)
         print("\nUse 'buildgen templates list' to see available templates.")
         sys.exit(1)
 
     # For show, we need the legacy type name to look up TEMPLATE_FILES
-    # Find the legacy name from recipe path
-    legacy_type = template_type
-    if template_type in LEGACY_TO_RECIPE_PATH.values():
-        for legacy, recipe in LEGACY_TO_RECIPE_PATH.items():
-            if recipe == template_type:
-                legacy_type = legacy
-                break
+    legacy_type = RECIPE_PATH_TO_LEGACY.get(template_type, template_type)
 
     env_tool = args.env
+    _check_env_tool(env_tool)
     resolved = resolve_template_files(legacy_type, env_tool, Path.cwd())
 
     print(f"Template: {recipe_path}")
@@ -1,73 +1,54 @@
 """Main CLI entry point for buildgen."""
 
+import os
 import sys
 
-from buildgen.cli.parsers import create_parser
+# Commands that take a subcommand, mapped to the attribute it is stored in
+COMMAND_GROUPS = {
+    "config": "config_command",
+    "makefile": "makefile_command",
+    "cmake": "cmake_command",
+    "templates": "templates_command",
+}
 
 
 def main() -> None:
     """Main CLI entry point."""
+    argv = sys.argv[1:]
+
+    # Answer version queries without building any parsers
+    if argv in (["-V"], ["--version"]):
+        from buildgen import __version__
+
+        print(f"buildgen {__version__}")
+        return
+
+    from buildgen.cli.parsers import create_parser, get_subparser
+
+    # Subcommand parsers are built on demand: only the one being run is built
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
-    # Commands with direct func (new, list, test, generate, render)
-    if args.command in ("new", "list", "test", "generate", "render"):
-        if hasattr(args, "func"):
-            try:
-                args.func(args)
-            except Exception as e:
-                print(f"Error: {e}", file=sys.stderr)
-                sys.exit(1)
+    # Command groups show their help when no subcommand is given. argparse
+    # always sets the group's dest (None when omitted), and every command
+    # parser sets func, so both are read directly.
+    group_attr = COMMAND_GROUPS.get(args.command)
+    if group_attr and vars(args)[group_attr] is None:
+        get_subparser(parser, args.command).print_help()
         return
 
-    # Handle config subcommands
-    if args.command == "config":
-        if not hasattr(args, "config_command") or not args.config_command:
-            parser.parse_args(["config", "--help"])
-        elif hasattr(args, "func"):
-            try:
-                args.func(args)
-            except Exception as e:
-                print(f"Error: {e}", file=sys.stderr)
-                sys.exit(1)
-        return
-
-    # Handle makefile subcommands
-    if args.command == "makefile":
-        if not hasattr(args, "makefile_command") or not args.makefile_command:
-            parser.parse_args(["makefile", "--help"])
-        elif hasattr(args, "func"):
-            try:
-                args.func(args)
-            except Exception as e:
-                print(f"Error: {e}", file=sys.stderr)
-                sys.exit(1)
-
-    # Handle cmake subcommands
-    elif args.command == "cmake":
-        if not hasattr(args, "cmake_command") or not args.cmake_command:
-            parser.parse_args(["cmake", "--help"])
-        elif hasattr(args, "func"):
-            try:
-                args.func(args)
-            except Exception as e:
-                print(f"Error: {e}", file=sys.stderr)
-                sys.exit(1)
-
-    # Handle templates subcommands
-    elif args.command == "templates":
-        if not hasattr(args, "templates_command") or not args.templates_command:
-            parser.parse_args(["templates", "--help"])
-        elif hasattr(args, "func"):
-            try:
-                args.func(args)
-            except Exception as e:
-                print(f"Error: {e}", file=sys.stderr)
-                sys.exit(1)
+    try:
+        args.func(args)
+    except Exception as e:
+        # --debug or BUILDGEN_DEBUG shows the full traceback instead
+        if args.debug or os.environ.get("BUILDGEN_DEBUG"):
+            raise
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
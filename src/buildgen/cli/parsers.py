@@ -1,26 +1,67 @@
 """CLI argument parser setup for buildgen."""
 
 import argparse
-
-from buildgen.recipes import RECIPES
-from buildgen.cli.commands import (
-    cmd_new,
-    cmd_list,
-    cmd_test,
-    cmd_generate,
-    cmd_render,
-    cmd_templates_list,
-    cmd_templates_copy,
-    cmd_templates_show,
-    cmd_config_init,
-    cmd_config_show,
-    cmd_config_path,
-)
+import functools
+from collections.abc import Callable
+from typing import Any, cast
+
+
+class LazySubParsersAction(argparse._SubParsersAction):
+    """Subparsers action that builds a subcommand's parser on first use.
+
+    Subcommands registered with add_lazy_parser() get a placeholder parser,
+    so they are listed in the help, until argparse dispatches to them. At
+    that point the placeholder is swapped for the parser built by the
+    subcommand's loader.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._loaders: dict[str, Callable[[argparse._SubParsersAction], None]] = {}
+
+    def add_lazy_parser(
+        self,
+        name: str,
+        loader: Callable[[argparse._SubParsersAction], None],
+        help: str,
+    ) -> None:
+        """Register a subcommand whose parser is built by ``loader``."""
+        self._loaders[name] = loader
+        self.add_parser(name, help=help, add_help=False)
+
+    def load(self, name: str) -> None:
+        """Replace a subcommand's placeholder with its real parser."""
+        loader = self._loaders.pop(name, None)
+        if loader is None:
+            return
+        # Drop the placeholder, build the real parser, then restore the
+        # original command order for the usage line and the help listing
+        names = list(self._name_parser_map)
+        del self._name_parser_map[name]
+        index = next(
+            i for i, action in enumerate(self._choices_actions) if action.dest == name
+        )
+        del self._choices_actions[index]
+        loader(self)
+        self._choices_actions.insert(index, self._choices_actions.pop())
+        parsers = dict(self._name_parser_map)
+        self._name_parser_map.clear()
+        self._name_parser_map.update((n, parsers[n]) for n in names)
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ) -> None:
+        self.load(values[0])
+        super().__call__(parser, namespace, values, option_string)
 
 
 def add_new_subparser(subparsers: argparse._SubParsersAction) -> None:
     """Add 'new' command parser."""
-    recipe_choices = list(RECIPES.keys())
+    from buildgen.cli.commands import cmd_new
 
     parser = subparsers.add_parser(
         "new",
@@ -43,7 +84,7 @@ Use 'buildgen list' to see available recipes.""",
     parser.add_argument(
         "-r",
         "--recipe",
-        choices=recipe_choices,
+        metavar="RECIPE",
         help="Recipe to use (default: cpp/executable)",
     )
     parser.add_argument(
@@ -54,7 +95,7 @@ Use 'buildgen list' to see available recipes.""",
     parser.add_argument(
         "-e",
         "--env",
-        choices=["uv", "venv"],
+        metavar="{uv,venv}",
         default=None,
         help="Environment tool for py/* recipes (default: uv)",
     )
@@ -63,6 +104,8 @@ Use 'buildgen list' to see available recipes.""",
 
 def add_list_subparser(subparsers: argparse._SubParsersAction) -> None:
     """Add 'list' command parser."""
+    from buildgen.cli.commands import cmd_list
+
     parser = subparsers.add_parser(
         "list",
         help="List available recipes",
@@ -84,7 +127,7 @@ Examples:
 
 def add_test_subparser(subparsers: argparse._SubParsersAction) -> None:
     """Add 'test' command parser."""
-    recipe_choices = list(RECIPES.keys())
+    from buildgen.cli.commands import cmd_test
 
     parser = subparsers.add_parser(
         "test",
@@ -97,12 +140,13 @@ Examples:
   buildgen test --all                     # Build and run tests
   buildgen test --category py --all       # Test Python recipes
   buildgen test --name py/cython --all    # Test specific recipe
-  buildgen test --build --keep -o /tmp    # Keep output for inspection""",
+  buildgen test --build --keep -o /tmp    # Keep output for inspection
+  buildgen test --all -j 2                # Test at most 2 recipes at a time""",
     )
     parser.add_argument(
         "-n",
         "--name",
-        choices=recipe_choices,
+        metavar="RECIPE",
         help="Test only this recipe",
     )
     parser.add_argument(
@@ -140,11 +184,20 @@ Examples:
         action="store_true",
         help="Keep output directory after testing",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of recipes to test concurrently (default: CPU count)",
+    )
     parser.set_defaults(func=cmd_test)
 
 
 def add_generate_subparser(subparsers: argparse._SubParsersAction) -> None:
     """Add 'generate' command parser."""
+    from buildgen.cli.commands import cmd_generate
+
     parser = subparsers.add_parser(
         "generate",
         help="Generate config or build files",
@@ -186,6 +239,8 @@ Examples:
 
 def add_render_subparser(subparsers: argparse._SubParsersAction) -> None:
     """Add 'render' command parser for configurable recipes."""
+    from buildgen.cli.commands import cmd_render
+
     parser = subparsers.add_parser(
         "render",
         help="Render a configurable recipe config into project files",
@@ -209,7 +264,7 @@ Examples:
     parser.add_argument(
         "-e",
         "--env",
-        choices=["uv", "venv"],
+        metavar="{uv,venv}",
         help="Override environment tool from the config options",
     )
     parser.set_defaults(func=cmd_render)
@@ -217,13 +272,11 @@ Examples:
 
 def add_templates_subparsers(subparsers: argparse._SubParsersAction) -> None:
     """Add templates subcommand parsers."""
-    from buildgen.skbuild.templates import SKBUILD_TYPES
-    from buildgen.templates.resolver import get_builtin_template_recipes
-
-    # Build choices: recipe paths + legacy names for backward compat
-    recipe_choices = get_builtin_template_recipes()
-    legacy_choices = list(SKBUILD_TYPES.keys())
-    all_choices = recipe_choices + legacy_choices
+    from buildgen.cli.commands import (
+        cmd_templates_copy,
+        cmd_templates_list,
+        cmd_templates_show,
+    )
 
     templates_parser = subparsers.add_parser(
         "templates",
@@ -270,7 +323,7 @@ Examples:
     )
     copy_parser.add_argument(
         "recipe",
-        choices=all_choices,
+        metavar="RECIPE",
         help="Recipe template to copy (e.g., py/pybind11)",
     )
     copy_parser.add_argument(
@@ -288,13 +341,13 @@ Examples:
     )
     show_parser.add_argument(
         "recipe",
-        choices=all_choices,
+        metavar="RECIPE",
         help="Recipe template to show (e.g., py/pybind11)",
     )
     show_parser.add_argument(
         "-e",
         "--env",
-        choices=["uv", "venv"],
+        metavar="{uv,venv}",
         default="uv",
         help="Environment tool (default: uv)",
     )
@@ -303,6 +356,12 @@ Examples:
 
 def add_config_subparsers(subparsers: argparse._SubParsersAction) -> None:
     """Add config subcommand parsers."""
+    from buildgen.cli.commands import (
+        cmd_config_init,
+        cmd_config_path,
+        cmd_config_show,
+    )
+
     config_parser = subparsers.add_parser(
         "config",
         help="Manage user configuration (~/.buildgen/config.toml)",
@@ -341,12 +400,68 @@ Examples:
     path_parser.set_defaults(func=cmd_config_path)
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the main CLI argument parser."""
-    from buildgen import __version__
+def add_makefile_subparser(subparsers: argparse._SubParsersAction) -> None:
+    """Add 'makefile' command parsers."""
     from buildgen.makefile.cli import add_makefile_subparsers
+
+    add_makefile_subparsers(subparsers)
+
+
+def add_cmake_subparser(subparsers: argparse._SubParsersAction) -> None:
+    """Add 'cmake' command parsers."""
     from buildgen.cmake.cli import add_cmake_subparsers
 
+    add_cmake_subparsers(subparsers)
+
+
+def get_subparser(
+    parser: argparse.ArgumentParser, name: str
+) -> argparse.ArgumentParser:
+    """Return the parser of a top-level subcommand, building it if needed."""
+    for action in parser._actions:
+        if isinstance(action, LazySubParsersAction):
+            action.load(name)
+            return action.choices[name]
+    raise KeyError(name)
+
+
+# Subcommand parser builders in help order, with the one-line help listed
+# for each command until its parser is built
+SUBCOMMANDS: dict[str, tuple[Callable[[argparse._SubParsersAction], None], str]] = {
+    # New simplified commands (Tier 1)
+    "new": (add_new_subparser, "Create a new project from a recipe"),
+    "list": (add_list_subparser, "List available recipes"),
+    "test": (add_test_subparser, "Test recipe generation and building"),
+    "generate": (add_generate_subparser, "Generate config or build files"),
+    "render": (
+        add_render_subparser,
+        "Render a configurable recipe config into project files",
+    ),
+    # Advanced commands (Tier 3)
+    "makefile": (add_makefile_subparser, "Makefile generation and direct compilation"),
+    "cmake": (add_cmake_subparser, "CMake generation and building"),
+    "templates": (add_templates_subparsers, "Manage project templates"),
+    "config": (
+        add_config_subparsers,
+        "Manage user configuration (~/.buildgen/config.toml)",
+    ),
+}
+
+
+@functools.cache
+def create_parser() -> argparse.ArgumentParser:
+    """Create the main CLI argument parser.
+
+    Subcommand parsers are built lazily, when argparse first dispatches to
+    them (see LazySubParsersAction).
+
+    The parser is built once and shared between callers. The only change
+    made to it afterwards is the lazy loader replacing a placeholder with
+    the real subcommand parser; callers must not add arguments or
+    subparsers to it. parse_args() is safe to call repeatedly.
+    """
+    from buildgen import __version__
+
     parser = argparse.ArgumentParser(
         prog="buildgen",
         description="Build system generator - Makefile, CMake, and more",
@@ -378,20 +493,19 @@ Examples:
     parser.add_argument(
         "-V", "--version", action="version", version=f"%(prog)s {__version__}"
     )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Show full tracebacks for errors (same as BUILDGEN_DEBUG=1)",
+    )
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # New simplified commands (Tier 1)
-    add_new_subparser(subparsers)
-    add_list_subparser(subparsers)
-    add_test_subparser(subparsers)
-    add_generate_subparser(subparsers)
-    add_render_subparser(subparsers)
-
-    # Advanced commands (Tier 3)
-    add_makefile_subparsers(subparsers)
-    add_cmake_subparsers(subparsers)
-    add_templates_subparsers(subparsers)
-    add_config_subparsers(subparsers)
+    subparsers = cast(
+        LazySubParsersAction,
+        parser.add_subparsers(
+            dest="command", help="Available commands", action=LazySubParsersAction
+        ),
+    )
+    for name, (add_subparser, help_text) in SUBCOMMANDS.items():
+        subparsers.add_lazy_parser(name, add_subparser, help_text)
 
     return parser
@@ -1,18 +1,42 @@
 """CMake generation and building support."""
 
-from buildgen.cmake.variables import (
-    CMakeVar,
-    CMakeCacheVar,
-    CMakeOption,
-    CMakeEnvVar,
-    cmake_var,
-    cmake_env_var,
-    cmake_cache_var,
-    cmake_bool,
-)
-from buildgen.cmake.generator import CMakeListsGenerator, CMakeWriter
-from buildgen.cmake.builder import CMakeBuilder
-from buildgen.cmake.functions import Cm
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Submodules are imported lazily on first attribute access (PEP 562) so that
+# importing e.g. the package's cli module does not load every generator.
+_LAZY_EXPORTS: dict[str, str] = {
+    "CMakeVar": "buildgen.cmake.variables",
+    "CMakeCacheVar": "buildgen.cmake.variables",
+    "CMakeOption": "buildgen.cmake.variables",
+    "CMakeEnvVar": "buildgen.cmake.variables",
+    "cmake_var": "buildgen.cmake.variables",
+    "cmake_env_var": "buildgen.cmake.variables",
+    "cmake_cache_var": "buildgen.cmake.variables",
+    "cmake_bool": "buildgen.cmake.variables",
+    "CMakeListsGenerator": "buildgen.cmake.generator",
+    "CMakeWriter": "buildgen.cmake.generator",
+    "CMakeBuilder": "buildgen.cmake.builder",
+    "Cm": "buildgen.cmake.functions",
+}
+
+if TYPE_CHECKING:
+    from buildgen.cmake.variables import (
+        CMakeVar,
+        CMakeCacheVar,
+        CMakeOption,
+        CMakeEnvVar,
+        cmake_var,
+        cmake_env_var,
+        cmake_cache_var,
+        cmake_bool,
+    )
+    from buildgen.cmake.generator import (
+        CMakeListsGenerator,
+        CMakeWriter,
+    )
+    from buildgen.cmake.builder import CMakeBuilder
+    from buildgen.cmake.functions import Cm
 
 __all__ = [
     # Variables
@@ -31,3 +55,17 @@ __all__ = [
     # Functions
     "Cm",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,11 +1,10 @@
 """CLI commands for CMake generation and building."""
 
-from buildgen.cmake.generator import CMakeListsGenerator
-from buildgen.cmake.builder import CMakeBuilder
-
 
 def cmd_generate(args) -> None:
     """Generate CMakeLists.txt using CMakeListsGenerator."""
+    from buildgen.cmake.generator import CMakeListsGenerator
+
     generator = CMakeListsGenerator(args.output)
 
     # Project settings
@@ -81,6 +80,8 @@ def cmd_generate(args) -> None:
 
 def cmd_build(args) -> None:
     """Build using CMakeBuilder."""
+    from buildgen.cmake.builder import CMakeBuilder
+
     builder = CMakeBuilder(
         source_dir=args.source_dir,
         build_dir=args.build_dir,
@@ -139,6 +140,8 @@ def cmd_build(args) -> None:
 
 def cmd_clean(args) -> None:
     """Clean CMake build directory."""
+    from buildgen.cmake.builder import CMakeBuilder
+
     builder = CMakeBuilder(build_dir=args.build_dir)
     builder.clean()
 
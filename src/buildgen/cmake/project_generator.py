@@ -8,6 +8,7 @@ from typing import Any, Dict, Optional
 
 from mako.template import Template
 from buildgen.common.config import UserConfig
+from buildgen.common.utils import write_files
 from buildgen.templates.resolver import TemplateResolver
 
 
@@ -211,7 +212,7 @@ class CMakeProjectGenerator:
         Returns:
             List of paths to created files.
         """
-        created_files = []
+        rendered: dict[Path, str] = {}
         template_files = self.TEMPLATE_FILES[self.recipe]
 
         for output_path_template, template_path in template_files.items():
@@ -222,14 +223,10 @@ class CMakeProjectGenerator:
             file_path = self._render_path(output_path_template)
 
             # Render template content
-            content = self._render_template(resolved_path)
+            rendered[file_path] = self._render_template(resolved_path)
 
-            # Create parent directories and write file
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(content)
-            created_files.append(file_path)
-
-        return created_files
+        # Create parent directories and write files in one pass
+        return write_files(rendered)
 
 
 def is_cmake_recipe(recipe: str) -> bool:
@@ -1,10 +1,32 @@
 """Common utilities shared across build system generators."""
 
-from buildgen.common.utils import UniqueList, check_output, env_var, always_true
-from buildgen.common.platform import PLATFORM, PythonSystem
-from buildgen.common.base import BaseGenerator, BaseBuilder
-from buildgen.common.project import ProjectConfig, TargetConfig, DependencyConfig
-from buildgen.common.config import UserConfig, load_user_config
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Submodules are imported lazily on first attribute access (PEP 562) so that
+# importing e.g. buildgen.common.config does not load every other module.
+_LAZY_EXPORTS: dict[str, str] = {
+    "UniqueList": "buildgen.common.utils",
+    "check_output": "buildgen.common.utils",
+    "env_var": "buildgen.common.utils",
+    "always_true": "buildgen.common.utils",
+    "PLATFORM": "buildgen.common.platform",
+    "PythonSystem": "buildgen.common.platform",
+    "BaseGenerator": "buildgen.common.base",
+    "BaseBuilder": "buildgen.common.base",
+    "ProjectConfig": "buildgen.common.project",
+    "TargetConfig": "buildgen.common.project",
+    "DependencyConfig": "buildgen.common.project",
+    "UserConfig": "buildgen.common.config",
+    "load_user_config": "buildgen.common.config",
+}
+
+if TYPE_CHECKING:
+    from buildgen.common.utils import UniqueList, check_output, env_var, always_true
+    from buildgen.common.platform import PLATFORM, PythonSystem
+    from buildgen.common.base import BaseGenerator, BaseBuilder
+    from buildgen.common.project import ProjectConfig, TargetConfig, DependencyConfig
+    from buildgen.common.config import UserConfig, load_user_config
 
 __all__ = [
     "UniqueList",
@@ -21,3 +43,17 @@ __all__ = [
     "UserConfig",
     "load_user_config",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
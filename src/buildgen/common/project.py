@@ -6,12 +6,28 @@ Define a project once, generate both Makefile and CMakeLists.txt.
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from buildgen.common.utils import PathLike
 
 
-@dataclass
+def _safe_load_yaml(stream: Any) -> Any:
+    """Parse YAML with the libyaml-backed loader when it is available.
+
+    Requires pyyaml to be installed.
+    """
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError(
+            "pyyaml is required for YAML support. Install with: pip install pyyaml"
+        ) from None
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
+
+
+@dataclass(slots=True)
 class TargetConfig:
     """Configuration for a build target (executable or library)."""
 
@@ -41,7 +57,7 @@ class TargetConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DependencyConfig:
     """Configuration for an external dependency."""
 
@@ -74,7 +90,7 @@ class DependencyConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectConfig:
     """Project configuration that can generate both Makefile and CMakeLists.txt."""
 
@@ -158,16 +174,8 @@ class ProjectConfig:
 
         Requires pyyaml to be installed.
         """
-        try:
-            import yaml
-        except ImportError:
-            raise ImportError(
-                "pyyaml is required for YAML support. Install with: pip install pyyaml"
-            ) from None
-
         with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        return cls.from_dict(data)
+            return cls.from_dict(_safe_load_yaml(f))
 
     @classmethod
     def load(cls, path: PathLike) -> "ProjectConfig":
@@ -180,11 +188,13 @@ class ProjectConfig:
         elif ext in (".yaml", ".yml"):
             return cls.from_yaml(path)
         else:
-            # Try JSON first, then YAML
+            # Try JSON first, then YAML, reading the file only once
+            text = path.read_text(encoding="utf-8")
             try:
-                return cls.from_json(path)
+                data = json.loads(text)
             except json.JSONDecodeError:
-                return cls.from_yaml(path)
+                data = _safe_load_yaml(text)
+            return cls.from_dict(data)
 
     def to_dict(self) -> dict:
         """Convert ProjectConfig to dictionary."""
@@ -27,6 +27,25 @@ def check_output(cmd: str) -> Optional[str]:
         return None
 
 
+def write_files(files: dict[Path, str]) -> list[Path]:
+    """Write rendered files, creating each parent directory only once.
+
+    Args:
+        files: Mapping of output path to file content, in write order.
+
+    Returns:
+        List of written paths.
+    """
+    created_dirs: set[Path] = set()
+    for path, content in files.items():
+        parent = path.parent
+        if parent not in created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(parent)
+        path.write_text(content)
+    return list(files)
+
+
 _T = TypeVar("_T")
 
 
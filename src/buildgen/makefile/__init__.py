@@ -1,14 +1,44 @@
 """Makefile generation and direct compilation support."""
 
-from buildgen.makefile.variables import Var, SVar, IVar, CVar, AVar
-from buildgen.makefile.generator import MakefileGenerator, MakefileWriter
-from buildgen.makefile.builder import Builder
-from buildgen.makefile.functions import (
-    AUTOMATIC_VARIABLES,
-    auto_var,
-    get_auto_var_help,
-    Mk,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Submodules are imported lazily on first attribute access (PEP 562) so that
+# importing e.g. the package's cli module does not load every generator.
+_LAZY_EXPORTS: dict[str, str] = {
+    "Var": "buildgen.makefile.variables",
+    "SVar": "buildgen.makefile.variables",
+    "IVar": "buildgen.makefile.variables",
+    "CVar": "buildgen.makefile.variables",
+    "AVar": "buildgen.makefile.variables",
+    "MakefileGenerator": "buildgen.makefile.generator",
+    "MakefileWriter": "buildgen.makefile.generator",
+    "Builder": "buildgen.makefile.builder",
+    "AUTOMATIC_VARIABLES": "buildgen.makefile.functions",
+    "auto_var": "buildgen.makefile.functions",
+    "get_auto_var_help": "buildgen.makefile.functions",
+    "Mk": "buildgen.makefile.functions",
+}
+
+if TYPE_CHECKING:
+    from buildgen.makefile.variables import (
+        Var,
+        SVar,
+        IVar,
+        CVar,
+        AVar,
+    )
+    from buildgen.makefile.generator import (
+        MakefileGenerator,
+        MakefileWriter,
+    )
+    from buildgen.makefile.builder import Builder
+    from buildgen.makefile.functions import (
+        AUTOMATIC_VARIABLES,
+        auto_var,
+        get_auto_var_help,
+        Mk,
+    )
 
 __all__ = [
     # Variables
@@ -27,3 +57,17 @@ __all__ = [
     "get_auto_var_help",
     "Mk",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
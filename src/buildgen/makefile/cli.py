@@ -1,11 +1,10 @@
 """CLI commands for Makefile generation and building."""
 
-from buildgen.makefile.builder import Builder
-from buildgen.makefile.generator import MakefileGenerator
-
 
 def cmd_build(args) -> None:
     """Build command using Builder class."""
+    from buildgen.makefile.builder import Builder
+
     builder = Builder(args.target)
 
     if args.cc:
@@ -38,6 +37,8 @@ def cmd_build(args) -> None:
 
 def cmd_makefile(args) -> None:
     """Generate Makefile using MakefileGenerator class."""
+    from buildgen.makefile.generator import MakefileGenerator
+
     generator = MakefileGenerator(args.output)
 
     if args.cxx:
@@ -6,6 +6,7 @@ Recipes use a `category/variant` naming convention:
 - py/pybind11, py/nanobind, py/cython, py/cext
 """
 
+import functools
 from dataclasses import dataclass, field
 from typing import Optional, Any
 
@@ -25,6 +26,11 @@ class Recipe:
     config_template: Optional[str] = None
     default_options: dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def skbuild_type(self) -> str:
+        """Legacy skbuild template type, e.g. "skbuild-pybind11"."""
+        return f"skbuild-{self.framework}"
+
 
 # Recipe registry with category/variant naming
 RECIPES: dict[str, Recipe] = {
@@ -237,9 +243,13 @@ def get_recipe(name: str) -> Recipe:
     return RECIPES[name]
 
 
+@functools.cache
 def get_recipes_by_category() -> dict[str, list[Recipe]]:
     """Get recipes grouped by category.
 
+    The registry is static, so the grouping is computed once and shared;
+    callers must treat the result as read-only.
+
     Returns:
         Dict mapping category names to lists of recipes
     """
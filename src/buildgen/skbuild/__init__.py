@@ -1,7 +1,31 @@
 """scikit-build-core project template generation."""
 
-from buildgen.skbuild.generator import SkbuildProjectGenerator
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Submodules are imported lazily on first attribute access (PEP 562) so that
+# importing e.g. the package's cli module does not load every generator.
+_LAZY_EXPORTS: dict[str, str] = {
+    "SkbuildProjectGenerator": "buildgen.skbuild.generator",
+}
+
+if TYPE_CHECKING:
+    from buildgen.skbuild.generator import SkbuildProjectGenerator
 
 __all__ = [
     "SkbuildProjectGenerator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,21 +1,21 @@
 """scikit-build-core project generator."""
 
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Optional, Any, Dict
 
 from mako.lookup import TemplateLookup
 from mako.template import Template
 from buildgen.common.config import UserConfig
+from buildgen.common.utils import write_files
 from buildgen.skbuild.templates import (
+    ENV_TOOLS,
     SKBUILD_TYPES,
     TEMPLATE_FILES,
     resolve_template_files,
 )
 from buildgen.templates.resolver import BUILTIN_TEMPLATES_DIR
 
-# Valid environment tool choices
-ENV_TOOLS = ("uv", "venv")
-
 
 class SkbuildProjectGenerator:
     """Generate scikit-build-core project files.
@@ -143,29 +143,30 @@ class SkbuildProjectGenerator:
             render_args.update(self.context)
         return template.render(**render_args)
 
-    def generate(self) -> list[Path]:
+    def generate(self, exclude: Iterable[str] | None = None) -> list[Path]:
         """Generate all project files.
 
+        Args:
+            exclude: Output paths (relative to output_dir, e.g.
+                     "project.flex.json") that should not be written.
+
         Returns:
             List of paths to created files.
         """
-        created_files = []
+        rendered: dict[Path, str] = {}
+        skipped = {self.output_dir / rel_path for rel_path in exclude or ()}
 
+        # Render everything first, then write in one pass
         for output_path_template, (
             template_path,
             source,
         ) in self.resolved_templates.items():
             file_path = self._render_path(output_path_template)
-            content = self._render_template(template_path)
-
-            # Create parent directories
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write file
-            file_path.write_text(content)
-            created_files.append(file_path)
+            if file_path in skipped:
+                continue
+            rendered[file_path] = self._render_template(template_path)
 
-        return created_files
+        return write_files(rendered)
 
     def get_description(self) -> str:
         """Get description for this template type."""
@@ -7,14 +7,19 @@ Template paths use recipe naming: py/pybind11, py/cython, py/cext, py/nanobind
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from mako.template import Template
 from buildgen.templates.resolver import BUILTIN_TEMPLATES_DIR, TemplateResolver
 
+if TYPE_CHECKING:
+    from mako.template import Template
+
 # Path to templates directory (built-in)
 TEMPLATES_DIR = BUILTIN_TEMPLATES_DIR
 
+# Valid environment tool choices
+ENV_TOOLS = ("uv", "venv")
+
 # Legacy skbuild type names (for backward compatibility)
 # Maps legacy names to descriptions
 SKBUILD_TYPES = {
@@ -34,6 +39,11 @@ LEGACY_TO_RECIPE_PATH = {
     "skbuild-nanobind": "py/nanobind",
 }
 
+# Reverse of LEGACY_TO_RECIPE_PATH: recipe template path -> legacy type name
+RECIPE_PATH_TO_LEGACY = {
+    recipe: legacy for legacy, recipe in LEGACY_TO_RECIPE_PATH.items()
+}
+
 # Mapping of template type to output file structure
 # Keys are output paths (with ${name} placeholder), values are template file paths
 # Template paths are relative to the recipe directory (e.g., py/pybind11/)
@@ -132,7 +142,7 @@ def get_recipe_path(template_type: str) -> str:
     return LEGACY_TO_RECIPE_PATH.get(template_type, template_type)
 
 
-def load_template(template_type: str, template_path: str) -> Template:
+def load_template(template_type: str, template_path: str) -> "Template":
     """Load a Mako template from the templates directory.
 
     Args:
@@ -142,6 +152,8 @@ def load_template(template_type: str, template_path: str) -> Template:
     Returns:
         Compiled Mako Template object.
     """
+    from mako.template import Template
+
     full_path = TEMPLATES_DIR / template_type / template_path
     return Template(filename=str(full_path))
 
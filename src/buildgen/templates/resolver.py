@@ -7,6 +7,7 @@ Resolves template paths with a four-tier hierarchy:
 4. Built-in: src/buildgen/templates/
 """
 
+import functools
 import os
 import shutil
 from pathlib import Path
@@ -113,10 +114,60 @@ class TemplateResolver:
 
         return overrides
 
+    def scan_all_overrides(self) -> dict[str, dict[str, str]]:
+        """List overrides for every recipe in one pass over the override roots.
 
+        Equivalent to calling list_overrides() for each ``category/variant``
+        recipe, but each override root is read once instead of once per
+        recipe.
+
+        Returns:
+            Dict mapping recipe path to a filename -> source label dict
+        """
+        overrides: dict[str, dict[str, str]] = {}
+
+        for source, search_path in self.search_paths:
+            if search_path is None or source == "built-in":
+                continue
+            for category in _scan_dirs(search_path):
+                for variant in _scan_dirs(category.path):
+                    recipe = f"{category.name}/{variant.name}"
+                    files = overrides.setdefault(recipe, {})
+                    for rel_path in _find_mako_files(variant.path):
+                        files.setdefault(rel_path, source)
+
+        return {recipe: files for recipe, files in overrides.items() if files}
+
+
+def _scan_dirs(path: str | Path) -> list[os.DirEntry[str]]:
+    """Return the subdirectories of path, or nothing if it is missing."""
+    try:
+        with os.scandir(path) as entries:
+            return [entry for entry in entries if entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _find_mako_files(root: str) -> list[str]:
+    """Return the .mako files under root as paths relative to it."""
+    found = []
+    for dirpath, _, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root)
+        for filename in filenames:
+            if filename.endswith(".mako"):
+                found.append(
+                    filename if rel_dir == "." else os.path.join(rel_dir, filename)
+                )
+    return found
+
+
+@functools.cache
 def get_builtin_template_recipes() -> list[str]:
     """Get available built-in template recipes.
 
+    The built-in templates ship with the package, so the directory is
+    scanned once and the result shared; callers must treat it as read-only.
+
     Returns:
         List of recipe paths (e.g., ["py/pybind11", "py/cython", ...])
     """
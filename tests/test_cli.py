@@ -1,9 +1,29 @@
 """CLI tests to ensure buildgen can be imported and run."""
 
+import os
 import subprocess
 import sys
 
 
+def _run_python(
+    *args: str, env: dict[str, str] | None = None
+) -> subprocess.CompletedProcess[str]:
+    """Run the test interpreter with buildgen importable from this checkout."""
+    child_env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path), **(env or {})}
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        env=child_env,
+        check=False,
+    )
+
+
+def _run_snippet(code: str) -> subprocess.CompletedProcess[str]:
+    """Run a python -c snippet in a fresh interpreter."""
+    return _run_python("-c", code)
+
+
 class TestCLIImport:
     """Test that CLI modules can be imported without errors."""
 
@@ -13,6 +33,50 @@ class TestCLIImport:
 
         assert hasattr(buildgen, "__version__")
 
+    def test_import_buildgen_is_lazy(self):
+        """Test that core exports are only imported on first access."""
+        code = (
+            "import sys, buildgen; "
+            "assert 'buildgen.makefile.generator' not in sys.modules; "
+            "assert buildgen.MakefileGenerator.__name__ == 'MakefileGenerator'; "
+            "assert 'buildgen.makefile.generator' in sys.modules"
+        )
+        result = _run_snippet(code)
+        assert result.returncode == 0, result.stderr
+
+    def test_import_common_is_lazy(self):
+        """Test that importing one common module leaves the others unloaded."""
+        code = (
+            "import sys; from buildgen.common.config import load_user_config; "
+            "assert 'buildgen.common.project' not in sys.modules; "
+            "from buildgen.common import ProjectConfig; "
+            "assert 'buildgen.common.project' in sys.modules"
+        )
+        result = _run_snippet(code)
+        assert result.returncode == 0, result.stderr
+
+    def test_create_parser_skips_generators(self):
+        """Test that building the parser does not load mako or generators."""
+        code = (
+            "import sys; from buildgen.cli import create_parser; create_parser(); "
+            "loaded = [m for m in sys.modules if m.startswith('mako') "
+            "or m.endswith(('.generator', '.builder'))]; "
+            "assert not loaded, loaded"
+        )
+        result = _run_snippet(code)
+        assert result.returncode == 0, result.stderr
+
+    def test_top_level_help_skips_commands(self):
+        """Test that the top-level help skips commands and recipes."""
+        code = (
+            "import sys; from buildgen.cli import create_parser; "
+            "create_parser().format_help(); "
+            "assert 'buildgen.cli.commands' not in sys.modules; "
+            "assert 'buildgen.recipes' not in sys.modules"
+        )
+        result = _run_snippet(code)
+        assert result.returncode == 0, result.stderr
+
     def test_import_cli(self):
         """Test that the CLI module can be imported."""
         from buildgen import cli
@@ -20,6 +84,17 @@ class TestCLIImport:
         assert hasattr(cli, "main")
         assert hasattr(cli, "create_parser")
 
+    def test_cli_main_is_function_after_submodule_import(self):
+        """Test that importing buildgen.cli.main leaves cli.main a function."""
+        code = (
+            "import types, buildgen.cli.main, buildgen.cli; "
+            "assert isinstance(buildgen.cli.main, types.FunctionType); "
+            "from buildgen.cli import main; "
+            "assert isinstance(main, types.FunctionType)"
+        )
+        result = _run_snippet(code)
+        assert result.returncode == 0, result.stderr
+
     def test_import_makefile_variables(self):
         """Test that makefile variables module can be imported."""
         from buildgen.makefile import variables
@@ -41,42 +116,61 @@ class TestCLIExecution:
 
     def test_cli_help(self):
         """Test that --help works."""
-        result = subprocess.run(
-            [sys.executable, "-m", "buildgen", "--help"],
-            capture_output=True,
-            text=True,
-        )
+        result = _run_python("-m", "buildgen", "--help")
         assert result.returncode == 0
         assert "buildgen" in result.stdout
         assert "Build system generator" in result.stdout
 
     def test_cli_version(self):
         """Test that --version works."""
-        result = subprocess.run(
-            [sys.executable, "-m", "buildgen", "--version"],
-            capture_output=True,
-            text=True,
-        )
+        result = _run_python("-m", "buildgen", "--version")
         assert result.returncode == 0
         assert "buildgen" in result.stdout
 
+    def test_cli_version_skips_parsers(self):
+        """Test that --version is answered without building the parsers."""
+        code = (
+            "import sys; sys.argv = ['buildgen', '--version']; "
+            "from buildgen.cli import main; main(); "
+            "assert 'buildgen.cli.parsers' not in sys.modules"
+        )
+        result = _run_snippet(code)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.startswith("buildgen ")
+
+    def test_cli_debug_shows_traceback(self, tmp_path):
+        """Test that --debug and BUILDGEN_DEBUG re-raise command errors."""
+        missing = str(tmp_path / "missing.json")
+        # An empty BUILDGEN_DEBUG counts as unset, whatever the outer env has
+        no_debug = {"BUILDGEN_DEBUG": ""}
+        result = _run_python(
+            "-m", "buildgen", "generate", "--from", missing, env=no_debug
+        )
+        assert result.returncode == 1
+        assert result.stderr.startswith("Error: ")
+        assert "Traceback" not in result.stderr
+
+        result = _run_python(
+            "-m", "buildgen", "--debug", "generate", "--from", missing, env=no_debug
+        )
+        assert result.returncode != 0
+        assert "Traceback" in result.stderr
+
+        result = _run_python(
+            "-m", "buildgen", "generate", "--from", missing, env={"BUILDGEN_DEBUG": "1"}
+        )
+        assert result.returncode != 0
+        assert "Traceback" in result.stderr
+
     def test_cli_list(self):
         """Test that 'list' command works."""
-        result = subprocess.run(
-            [sys.executable, "-m", "buildgen", "list"],
-            capture_output=True,
-            text=True,
-        )
+        result = _run_python("-m", "buildgen", "list")
         assert result.returncode == 0
         assert "Available recipes" in result.stdout
 
     def test_cli_no_command_shows_help(self):
         """Test that running without a command shows help."""
-        result = subprocess.run(
-            [sys.executable, "-m", "buildgen"],
-            capture_output=True,
-            text=True,
-        )
+        result = _run_python("-m", "buildgen")
         # Exit code 1 is expected when no command given
         assert result.returncode == 1
         assert "usage:" in result.stdout.lower() or "usage:" in result.stderr.lower()
@@ -93,6 +187,12 @@ class TestCLIParser:
         assert parser is not None
         assert parser.prog == "buildgen"
 
+    def test_create_parser_is_cached(self):
+        """Test that the parser is built once and shared."""
+        from buildgen.cli import create_parser
+
+        assert create_parser() is create_parser()
+
     def test_parser_new_command(self):
         """Test parsing 'new' command."""
         from buildgen.cli import create_parser
@@ -128,3 +228,173 @@ class TestCLIParser:
         args = parser.parse_args(["list", "-c", "py"])
         assert args.command == "list"
         assert args.category == "py"
+
+    def test_parser_test_jobs(self):
+        """Test parsing 'test' command with a worker count."""
+        from buildgen.cli import create_parser
+
+        parser = create_parser()
+        args = parser.parse_args(["test", "-c", "c", "-j", "2"])
+        assert args.command == "test"
+        assert args.jobs == 2
+
+    def test_unknown_template_rejected_by_command(self, capsys):
+        """Recipe names are validated by the command, not by argparse."""
+        import pytest
+
+        from buildgen.cli import create_parser
+
+        parser = create_parser()
+        args = parser.parse_args(["templates", "copy", "bogus"])
+        with pytest.raises(SystemExit) as exc_info:
+            args.func(args)
+        assert exc_info.value.code == 1
+        assert "Unknown template: bogus" in capsys.readouterr().err
+
+    def test_unknown_env_rejected_by_command(self, tmp_path, capsys):
+        """--env values are validated by the command, not by argparse."""
+        import pytest
+
+        from buildgen.cli import create_parser
+
+        parser = create_parser()
+        args = parser.parse_args(
+            ["new", "myapp", "-r", "c/executable", "-o", str(tmp_path / "app")]
+            + ["--env", "conda"]
+        )
+        with pytest.raises(SystemExit) as exc_info:
+            args.func(args)
+        assert exc_info.value.code == 1
+        assert "Invalid env option 'conda'" in capsys.readouterr().err
+        assert not (tmp_path / "app").exists()
+
+    def test_legacy_recipe_name_accepted(self, tmp_path, capsys):
+        """Legacy recipe names map to their canonical recipe."""
+        from buildgen.cli import create_parser
+
+        parser = create_parser()
+        args = parser.parse_args(
+            ["new", "myapp", "-r", "executable", "-o", str(tmp_path / "app")]
+        )
+        args.func(args)
+        assert "Created cpp/executable project" in capsys.readouterr().out
+        assert (tmp_path / "app" / "CMakeLists.txt").exists()
+
+    def test_subparsers_built_on_demand(self):
+        """Subcommand parsers are built on dispatch without changing the help."""
+        from buildgen.cli.parsers import SUBCOMMANDS, create_parser
+
+        parser = create_parser.__wrapped__()
+        subparsers = parser._subparsers._group_actions[0]
+        initial_help = parser.format_help()
+        assert set(subparsers._loaders) == set(SUBCOMMANDS)
+
+        args = parser.parse_args(["new", "myproject", "-r", "c/static"])
+        assert args.recipe == "c/static"
+        assert "new" not in subparsers._loaders
+        assert "list" in subparsers._loaders
+        assert parser.format_help() == initial_help
+
+        for name in SUBCOMMANDS:
+            subparsers.load(name)
+        assert not subparsers._loaders
+        assert parser.format_help() == initial_help
+
+    def test_get_subparser(self):
+        """Test looking up a command group's parser for its help."""
+        from buildgen.cli.parsers import create_parser, get_subparser
+
+        templates = get_subparser(create_parser.__wrapped__(), "templates")
+        assert templates.prog == "buildgen templates"
+        assert "{list,copy,show}" in templates.format_help()
+
+
+class TestCLITestCommand:
+    """Test the 'test' command without building."""
+
+    def test_generate_concurrently_in_order(self, tmp_path, capsys):
+        """Recipes are generated concurrently but reported in order."""
+        from buildgen.cli import create_parser
+        from buildgen.recipes import get_recipes_by_category
+
+        parser = create_parser()
+        args = parser.parse_args(["test", "-c", "c", "-o", str(tmp_path), "-j", "3"])
+        args.func(args)
+
+        out = capsys.readouterr().out
+        names = [r.name for r in get_recipes_by_category()["c"]]
+        positions = [out.index(f"  {name} ") for name in names]
+        assert positions == sorted(positions)
+        assert f"Total: {len(names)}, Generated: {len(names)}" in out
+        for name in names:
+            project = tmp_path / name.replace("/", "_").replace("-", "_")
+            assert (project / "CMakeLists.txt").exists()
+
+    def test_interactive_status_line(self, tmp_path, capsys, monkeypatch):
+        """On a terminal, progress is rewritten in place on one line."""
+        from buildgen.cli import create_parser
+        from buildgen.recipes import get_recipes_by_category
+
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+        parser = create_parser()
+        args = parser.parse_args(["test", "-c", "c", "-o", str(tmp_path)])
+        args.func(args)
+
+        out = capsys.readouterr().out
+        count = len(get_recipes_by_category()["c"])
+        assert out.count("\r") == count
+        assert f"  {count}/{count} " in out
+        assert f"Total: {count}, Generated: {count}" in out
+
+    def test_unknown_recipe_points_to_list(self, capsys):
+        """An unknown -n name is rejected with a pointer to 'buildgen list'."""
+        import pytest
+
+        from buildgen.cli import create_parser
+
+        parser = create_parser()
+        args = parser.parse_args(["test", "-n", "bogus"])
+        with pytest.raises(SystemExit) as exc_info:
+            args.func(args)
+        assert exc_info.value.code == 1
+        captured = capsys.readouterr()
+        assert "Unknown recipe 'bogus'" in captured.err
+        assert "Use 'buildgen list' to see available recipes." in captured.out
+
+    def test_run_step_reports_stderr_tail(self, tmp_path):
+        """Failed steps report the end of stderr, and nothing on success."""
+        from buildgen.cli.commands import _run_step
+
+        ok = [sys.executable, "-c", "print('noise' * 1000)"]
+        assert _run_step(ok, tmp_path, 60, "Build failed") is None
+
+        code = "import sys; sys.stderr.write('x' * 1000 + 'real error'); sys.exit(1)"
+        error = _run_step([sys.executable, "-c", code], tmp_path, 60, "Build failed")
+        assert len(error) == 500
+        assert error.endswith("real error")
+
+        silent = [sys.executable, "-c", "raise SystemExit(1)"]
+        assert _run_step(silent, tmp_path, 60, "Build failed") == "Build failed"
+
+
+class TestCLIGenerateCommand:
+    """Test the 'generate' command."""
+
+    def test_generate_boilerplate_configs(self, tmp_path, capsys):
+        """Boilerplate JSON and YAML configs load back as equivalent projects."""
+        from buildgen.cli import create_parser
+        from buildgen.common.project import ProjectConfig
+
+        parser = create_parser()
+        configs = {}
+        for filename in ("project.json", "project.yaml"):
+            path = tmp_path / filename
+            args = parser.parse_args(["generate", "--config", str(path)])
+            args.func(args)
+            configs[filename] = ProjectConfig.load(path)
+
+        json_cfg, yaml_cfg = configs["project.json"], configs["project.yaml"]
+        assert json_cfg.name == yaml_cfg.name == "myproject"
+        assert json_cfg.cxx_standard == yaml_cfg.cxx_standard == 17
+        assert [t.name for t in json_cfg.targets] == ["myapp"]
+        assert "Created config template" in capsys.readouterr().out
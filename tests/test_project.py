@@ -503,6 +503,18 @@ class TestProjectConfigYAML:
 
             Path(f.name).unlink()
 
+    def test_load_yaml_without_extension(self, yaml_available, tmp_path):
+        """Test ProjectConfig.load() falls back to YAML for unknown extensions."""
+        if not yaml_available:
+            pytest.skip("pyyaml not available")
+
+        path = tmp_path / "project.cfg"
+        path.write_text("name: testproject\ncxx_standard: 20\n")
+
+        config = ProjectConfig.load(path)
+        assert config.name == "testproject"
+        assert config.cxx_standard == 20
+
     def test_yaml_import_error(self):
         """Test helpful error message when pyyaml not available."""
         # This test is tricky - we can't easily mock the import
@@ -45,7 +45,6 @@ def _generate_project(
     if recipe.build_system == "cmake":
         generator = CMakeProjectGenerator(project_name, recipe_name, output_dir)
     elif recipe.build_system == "skbuild":
-        skbuild_type = f"skbuild-{recipe.framework}"
         env_tool = recipe.default_options.get("env", "uv")
         context = {}
         if recipe.default_options:
@@ -61,7 +60,7 @@ def _generate_project(
                 context[key] = value
         generator = SkbuildProjectGenerator(
             project_name,
-            skbuild_type,
+            recipe.skbuild_type,
             output_dir,
             env_tool=env_tool,
             context=context or None,
@@ -1,6 +1,10 @@
 """Tests for scikit-build-core project generation."""
 
 import argparse
+import datetime
+import json
+import sys
+import types
 
 import pytest
 
@@ -226,6 +230,17 @@ class TestPybind11FlexGeneration:
         }
         assert expected.issubset(set(created))
 
+    def test_generate_excludes_files(self, tmp_path):
+        """Excluded output paths are neither written nor reported."""
+        gen = SkbuildProjectGenerator(
+            "myflex", "skbuild-pybind11-flex", output_dir=tmp_path
+        )
+        created = gen.generate(exclude={"project.flex.json"})
+
+        assert not (tmp_path / "project.flex.json").exists()
+        assert tmp_path / "project.flex.json" not in created
+        assert (tmp_path / "CMakeLists.txt") in created
+
     def test_cmake_content_has_options(self, output_dir):
         """Test that CMakeLists.txt exposes configuration toggles."""
         gen = SkbuildProjectGenerator("flexext", "skbuild-pybind11-flex", output_dir)
@@ -301,6 +316,172 @@ class TestConfigurableWorkflow:
         assert "<options" not in rendered_config
         assert "-DTEST_FRAMEWORK=gtest" in rendered_config
 
+    def test_render_yaml_config(self, tmp_path):
+        """buildgen render should accept YAML configs and emit plain YAML."""
+        import json
+
+        import yaml
+
+        config_dir = tmp_path / "flexyaml"
+        args = argparse.Namespace(
+            name="flexyaml",
+            recipe="py/pybind11-flex",
+            output=str(config_dir),
+            env="uv",
+        )
+        cmd_new(args)
+        data = json.loads((config_dir / "project.flex.json").read_text())
+        data["options"]["test_framework"] = "gtest"
+        yaml_config = config_dir / "project.flex.yaml"
+        yaml_config.write_text(yaml.safe_dump(data, sort_keys=False))
+
+        output_dir = tmp_path / "rendered"
+        render_args = argparse.Namespace(
+            config=str(yaml_config), output=str(output_dir), env=None
+        )
+        cmd_render(render_args)
+
+        assert not (output_dir / "project.flex.yaml").exists()
+        rendered = yaml.safe_load((output_dir / "project.yaml").read_text())
+        assert "options" not in rendered
+        assert rendered["name"] == "flexyaml"
+        assert "-DTEST_FRAMEWORK=gtest" in str(rendered)
+
+    def test_resolve_option_tokens(self):
+        """Known placeholders are substituted, unknown ones are kept."""
+        from buildgen.cli.commands import _resolve_option_tokens
+
+        options = {"env": "venv", "build_examples": True}
+        data = {
+            "flags": ["-DENV=<options.env>", "-DX=<options.missing>"],
+            "nested": {"examples": "<options.build_examples>"},
+            "plain": "src/main.cpp",
+            "count": 3,
+        }
+        resolved = _resolve_option_tokens(data, options)
+        assert resolved == {
+            "flags": ["-DENV=venv", "-DX=<options.missing>"],
+            "nested": {"examples": "True"},
+            "plain": "src/main.cpp",
+            "count": 3,
+        }
+
+    def test_create_plain_config_is_independent(self):
+        """The plain config drops metadata and shares no containers."""
+        from buildgen.cli.commands import _create_plain_config
+
+        data = {
+            "options": {"env": "venv"},
+            "_notes": ["note"],
+            "project": {"name": "demo", "env": "<options.env>"},
+            "targets": [{"sources": ["src/main.cpp"]}],
+        }
+        plain = _create_plain_config(data, data["options"])
+        assert plain == {
+            "project": {"name": "demo", "env": "venv"},
+            "targets": [{"sources": ["src/main.cpp"]}],
+        }
+        plain["targets"][0]["sources"].append("src/extra.cpp")
+        assert data["targets"][0]["sources"] == ["src/main.cpp"]
+
+    @staticmethod
+    def _fake_orjson(dumps):
+        """Build a stand-in orjson module around the given dumps function."""
+        module = types.ModuleType("orjson")
+        module.OPT_INDENT_2 = 1
+        module.OPT_APPEND_NEWLINE = 2
+        module.OPT_NON_STR_KEYS = 4
+        module.dumps = dumps
+        return module
+
+    def test_dump_json_bytes_uses_orjson(self, monkeypatch):
+        """When orjson is importable its output is written as-is."""
+        from buildgen.cli.commands import _dump_json_bytes
+
+        calls = []
+
+        def dumps(data, option):
+            calls.append(option)
+            return (json.dumps(data, indent=2) + "\n").encode()
+
+        monkeypatch.setitem(sys.modules, "orjson", self._fake_orjson(dumps))
+        data = {"name": "demo", "targets": [1, 2]}
+        assert _dump_json_bytes(data) == (json.dumps(data, indent=2) + "\n").encode()
+        assert calls == [1 | 2 | 4]
+
+    def test_dump_json_bytes_orjson_fallbacks(self, monkeypatch):
+        """Rejected input and incompatible values fall back to the json module."""
+        from buildgen.cli.commands import _dump_json_bytes
+
+        def rejecting(data, option):
+            raise TypeError("Integer exceeds 64-bit range")
+
+        monkeypatch.setitem(sys.modules, "orjson", self._fake_orjson(rejecting))
+        data = {"big": 2**70}
+        assert _dump_json_bytes(data) == (json.dumps(data, indent=2) + "\n").encode()
+
+        def raw_utf8(data, option):
+            return json.dumps(data, indent=2, ensure_ascii=False).encode() + b"\n"
+
+        monkeypatch.setitem(sys.modules, "orjson", self._fake_orjson(raw_utf8))
+        data = {"author": "Andr\u00e9"}
+        assert _dump_json_bytes(data) == b'{\n  "author": "Andr\\u00e9"\n}\n'
+
+        def unexpected(data, option):
+            raise AssertionError("orjson should not be used")
+
+        monkeypatch.setitem(sys.modules, "orjson", self._fake_orjson(unexpected))
+        data = {"opts": {"tolerance": 1e-05}, "tags": ["\u00e9t\u00e9"]}
+        assert _dump_json_bytes(data) == (json.dumps(data, indent=2) + "\n").encode()
+
+    def test_dump_json_bytes_matches_json_with_orjson(self):
+        """Real orjson output is byte-identical to json.dumps(indent=2)."""
+        pytest.importorskip("orjson")
+        from buildgen.cli.commands import _dump_json_bytes
+
+        data = {
+            "name": "demo",
+            "version": "0.1.0",
+            "cxx_standard": 17,
+            "flags": [],
+            "options": {},
+            "targets": [{"name": "app", "install": True, "prefix": None}],
+            1: "non-str key",
+        }
+        assert _dump_json_bytes(data) == (json.dumps(data, indent=2) + "\n").encode()
+
+        for value in (1e-05, 2.5, float("nan"), float("inf")):
+            data = {"name": "demo", "value": value}
+            expected = (json.dumps(data, indent=2) + "\n").encode()
+            assert _dump_json_bytes(data) == expected
+
+        data = {"name": "demo", "released": datetime.date(2024, 1, 2)}
+        with pytest.raises(TypeError):
+            json.dumps(data)
+        with pytest.raises(TypeError):
+            _dump_json_bytes(data)
+
+    def test_config_template_compiled_once(self, tmp_path):
+        """Repeated buildgen new should reuse the compiled config template."""
+        from buildgen.cli.commands import _load_config_template
+
+        _load_config_template.cache_clear()
+        for name in ("flexone", "flextwo"):
+            args = argparse.Namespace(
+                name=name,
+                recipe="py/pybind11-flex",
+                output=str(tmp_path / name),
+                env="uv",
+            )
+            cmd_new(args)
+
+        info = _load_config_template.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+        assert (
+            '"name": "flextwo"' in (tmp_path / "flextwo/project.flex.json").read_text()
+        )
+
 
 class TestCythonGeneration:
     """Test Cython project generation."""
@@ -15,6 +15,7 @@ from buildgen.skbuild.templates import (
     TEMPLATES_DIR,
     resolve_template_files,
     LEGACY_TO_RECIPE_PATH,
+    RECIPE_PATH_TO_LEGACY,
 )
 
 
@@ -42,6 +43,13 @@ class TestBuiltinTemplates:
         # Common should not be in the list
         assert "common" not in recipes
 
+    def test_get_builtin_template_recipes_cached(self):
+        """Test that the built-in templates directory is scanned once."""
+        get_builtin_template_recipes.cache_clear()
+        first = get_builtin_template_recipes()
+        assert get_builtin_template_recipes() is first
+        assert get_builtin_template_recipes.cache_info().hits == 1
+
     def test_get_builtin_template_types(self):
         """Test getting available template types (legacy)."""
         types = get_builtin_template_types()
@@ -166,6 +174,35 @@ class TestTemplateResolver:
         overrides = resolver.list_overrides("py/pybind11")
         assert overrides == {}
 
+    def test_scan_all_overrides(self, tmp_path, monkeypatch):
+        """Test that one scan matches list_overrides for every recipe."""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.setenv("BUILDGEN_TEMPLATES", str(tmp_path / "env_templates"))
+
+        local_dir = tmp_path / ".buildgen/templates/py/pybind11"
+        (local_dir / "src").mkdir(parents=True)
+        (local_dir / "pyproject.toml.mako").write_text("# Local")
+        (local_dir / "src" / "module.cpp.mako").write_text("// Local")
+        env_dir = tmp_path / "env_templates/py/pybind11"
+        env_dir.mkdir(parents=True)
+        (env_dir / "pyproject.toml.mako").write_text("# Env")
+        global_dir = tmp_path / "home/.buildgen/templates/cpp/executable"
+        global_dir.mkdir(parents=True)
+        (global_dir / "CMakeLists.txt.mako").write_text("# Global")
+
+        resolver = TemplateResolver(tmp_path)
+        all_overrides = resolver.scan_all_overrides()
+        assert set(all_overrides) == {"py/pybind11", "cpp/executable"}
+        for recipe, overrides in all_overrides.items():
+            assert overrides == resolver.list_overrides(recipe)
+        assert all_overrides["py/pybind11"]["pyproject.toml.mako"] == "env"
+
+    def test_scan_all_overrides_empty(self, tmp_path, monkeypatch):
+        """Test scanning when no override directories exist."""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.delenv("BUILDGEN_TEMPLATES", raising=False)
+        assert TemplateResolver(tmp_path).scan_all_overrides() == {}
+
 
 class TestCopyTemplates:
     """Test copy_templates function."""
@@ -285,3 +322,18 @@ class TestSkbuildTypes:
         assert LEGACY_TO_RECIPE_PATH["skbuild-cython"] == "py/cython"
         assert LEGACY_TO_RECIPE_PATH["skbuild-c"] == "py/cext"
         assert LEGACY_TO_RECIPE_PATH["skbuild-nanobind"] == "py/nanobind"
+
+    def test_recipe_to_legacy_mapping(self):
+        """Test recipe path to legacy type mapping is the exact inverse."""
+        assert RECIPE_PATH_TO_LEGACY["py/cext"] == "skbuild-c"
+        assert len(RECIPE_PATH_TO_LEGACY) == len(LEGACY_TO_RECIPE_PATH)
+        for legacy, recipe in LEGACY_TO_RECIPE_PATH.items():
+            assert RECIPE_PATH_TO_LEGACY[recipe] == legacy
+
+    def test_skbuild_recipes_map_to_types(self):
+        """Test every skbuild recipe names a known legacy template type."""
+        from buildgen.recipes import RECIPES
+
+        for recipe in RECIPES.values():
+            if recipe.build_system == "skbuild":
+                assert recipe.skbuild_type in SKBUILD_TYPES